@@ -12,18 +12,72 @@ __author__ = "Bimi"
 __license__ = "MIT"
 __version__ = "1.1.1"
 
-from typing import NamedTuple
+import importlib
+
+from typing import TYPE_CHECKING, Any, List, NamedTuple
 
 from . import utils
-from .client import Client
 from .errors import *
-from .profile import *
-from .club import *
-from .brawler import *
-from .member import *
-from .leaderboard import *
-from .battlelog import *
-from .rotation import *
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .profile import Profile
+    from .club import Club
+    from .brawler import Brawler, Gadget, StarPower, Gear
+    from .member import Member
+    from .leaderboard import LeaderboardPlayerEntry, LeaderboardClubEntry
+    from .battlelog import BattlelogEntry, EntryPlayer, EntryBrawler
+    from .rotation import EventSlot, EventDetails
+
+# the client and models are only imported once they're first accessed,
+# so that `import bstats` doesn't pull in aiohttp and every submodule
+_LAZY = {
+    "Client": ".client",
+    "Profile": ".profile",
+    "Club": ".club",
+    "Brawler": ".brawler",
+    "Gadget": ".brawler",
+    "StarPower": ".brawler",
+    "Gear": ".brawler",
+    "Member": ".member",
+    "LeaderboardPlayerEntry": ".leaderboard",
+    "LeaderboardClubEntry": ".leaderboard",
+    "BattlelogEntry": ".battlelog",
+    "EntryPlayer": ".battlelog",
+    "EntryBrawler": ".battlelog",
+    "EventSlot": ".rotation",
+    "EventDetails": ".rotation"
+}
+
+__all__ = [
+    "utils",
+    "version_info",
+    "APIException",
+    "HTTPError",
+    "ProcessingError",
+    "InvalidSuppliedTag",
+    "InappropriateFormat",
+    "NoSuppliedToken",
+    "Forbidden",
+    "NotFound",
+    "RateLimited",
+    "UnknownServerError",
+    "MaintenanceError",
+    *_LAZY
+]
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY})
 
 
 class VerInfo(NamedTuple):
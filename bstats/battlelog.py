@@ -23,8 +23,11 @@ DEALINGS IN THE SOFTWARE.
 """
 
 import datetime
+import sys
 
-from .utils import camel_to_snake
+from functools import cached_property
+from itertools import chain
+from .utils import format_mode, parse_time
 from typing import (
     Any,
     List,
@@ -34,6 +37,15 @@ from typing import (
     TypeVar
 )
 
+# interned so that comparing results against these is an identity check
+_RESULTS = {
+    "victory": sys.intern("Victory"),
+    "defeat": sys.intern("Defeat"),
+    "draw": sys.intern("Draw")
+}
+_COMMUNITY_MAP = sys.intern("Community Map")
+
+
 class EntryBrawler:
     """
     # Do not manually initialise this.
@@ -49,6 +61,8 @@ class EntryBrawler:
     trophies: `int`
         The brawler's trophies at the time of the entry.
     """
+    __slots__ = ("_name", "_id", "_power", "_trophies")
+
     def __init__(self, brawler: Any) -> None:
         self.push_data(brawler)
 
@@ -56,7 +70,7 @@ class EntryBrawler:
         return f"<{self.__class__.__name__} name={self.name!r} id={self.id} power={self.power} trophies={self.trophies}>"
 
     def push_data(self, data: Any) -> None:
-        self._name: str = data["name"]
+        self._name: str = data["name"].title()
         self._id: int = data["id"]
         self._power: int = data["power"]
         self._trophies: int = data["trophies"]
@@ -65,7 +79,7 @@ class EntryBrawler:
     @property
     def name(self) -> str:
         """`str`: The brawler's name."""
-        return self._name.title()
+        return self._name
 
     @property
     def id(self) -> int:
@@ -95,6 +109,8 @@ class EntryPlayer:
     brawler: `~.EntryBrawler`
         A `EntryBrawler` object representing the player's brawler.
     """
+    __slots__ = ("_name", "_tag", "_brawler")
+
     def __init__(self, player: Any) -> None:
         self.push_data(player)
 
@@ -140,87 +156,94 @@ class BattlelogEntry:
         The mode's map. If `None`, return "Community Map".
     result: `str`
         The result of the battle (Defeat/Draw/Victory in case of 3v3, the rank in case of showdown).
-    time: `str`
+    time: `datetime.datetime`
         The time at which the entry was recorded.
     duration: Tuple[`int`, `int`]
         How long the battle lasted.
     trophy_change: `int`
         The amount of trophies the player gained or lost from the battle.
-    players: List[`~.EntryPlayer`]
+        `0` if the battle did not affect trophies.
+    players: Tuple[`~.EntryPlayer`, ...]
         The players that took part in the battle.
-    star_player: `~.EntryPlayer`
+    star_player: Optional[`~.EntryPlayer`]
         The star player of the battle.
+        `None` if the battle has no star player (i.e. showdown).
     """
+    __slots__ = (
+        "_name", "_id", "_map", "_result", "_time", "_duration",
+        "_trophy_change", "_teams", "_players", "_star_player",
+        "__dict__" # storage for the cached properties
+    )
+
     def __init__(self: BE, data: Any) -> None:
-        self.push_data({camel_to_snake(key): value for key, value in data.items()})
+        self.push_data(data)
 
     def __repr__(self: BE) -> str:
         return f"<{self.__class__.__name__} name={self.name!r} result={self.result!r}>"
 
     def push_data(self: BE, data: Any) -> None:
-        self._name: str = data["event"]["mode"] or data["battle"]["mode"]
-        self._id: int = data["event"]["id"]
-        self._map: Optional[str] = data["event"].get("map")
-        self._result: Union[int, str] = data["battle"]["result"] or data["battle"]["rank"]
-        self._time: str = data["battle_time"]
-        self._duration: int = data["battle"]["duration"]
-        self._trophy_change: int = data["battle"]["trophyChange"]
-        self._players: Union[List[List[Any]], List[Any]] = data["battle"]["teams"] or data["battle"]["players"]
-        self._star_player: Any = data["battle"]["starPlayer"]
-
-
-    @property
+        event, battle = data["event"], data["battle"]
+        self._name: str = event.get("mode") or battle["mode"]
+        self._id: int = event["id"]
+        self._map: Optional[str] = event.get("map")
+        self._result: Union[int, str] = battle.get("result") or battle["rank"]
+        self._time: str = data["battleTime"]
+        self._duration: int = battle["duration"]
+        self._trophy_change: int = battle.get("trophyChange", 0)
+        self._teams: Optional[List[List[Any]]] = battle.get("teams")
+        self._players: Optional[List[Any]] = battle.get("players")
+        self._star_player: Optional[Any] = battle.get("starPlayer")
+
+
+    @cached_property
     def name(self: BE) -> str:
         """`str`: The mode's name."""
-        name = " ".join([word.capitalize() for word in camel_to_snake(self._name).split("_")])
-        return name
+        return format_mode(self._name)
 
     @property
     def id(self: BE) -> int:
         """`int`: The mode's ID."""
         return self._id
 
-    @property
+    @cached_property
     def map(self: BE) -> str:
         """`str`: The mode's map. If `None`, return "Community Map"."""
         if self._map:
             return self._map
-        return "Community Map"
+        return _COMMUNITY_MAP
 
-    @property
+    @cached_property
     def result(self: BE) -> str:
         """`str`: The result of the battle (Defeat/Draw/Victory in case of 3v3, the rank in case of showdown)."""
         if type(self._result) is int:
             return f"Rank {self._result}"
-        return self._result.capitalize()
+        return _RESULTS.get(self._result) or self._result.capitalize()
 
-    @property
+    @cached_property
     def time(self: BE) -> datetime.datetime:
-        """`str`: The time at which the entry was recorded."""
-        return datetime.datetime.strptime(self._time, "%Y%m%dT%H%M%S.%fZ")
+        """`datetime.datetime`: The time at which the entry was recorded."""
+        return parse_time(self._time)
 
-    @property
+    @cached_property
     def duration(self: BE) -> Tuple[int, int]:
         """Tuple[`int`, `int`]: How long the battle lasted."""
         return divmod(self._duration, 60)
 
     @property
     def trophy_change(self: BE) -> int:
-        """`int`: The amount of trophies the player gained or lost from the battle."""
+        """`int`: The amount of trophies the player gained or lost from the battle. `0` if the battle did not affect trophies."""
         return self._trophy_change
 
-    @property
-    def players(self: BE) -> List[EntryPlayer]:
-        """List[`~.EntryPlayer`]: The players that took part in the battle."""
-        try:
-            getattr(self._players[0], "append")
-        except AttributeError:
-            return [EntryPlayer(player) for player in self._players]
-        else:
-            from functools import reduce
-            return reduce(lambda x, y: x + y, self._players)
-
-    @property
-    def star_player(self: BE) -> EntryPlayer:
-        """`~.EntryPlayer`: The star player of the battle."""
-        return EntryPlayer(self._star_player)
+    @cached_property
+    def players(self: BE) -> Tuple[EntryPlayer, ...]:
+        """Tuple[`~.EntryPlayer`, ...]: The players that took part in the battle."""
+        if self._teams is not None:
+            return tuple(map(EntryPlayer, chain.from_iterable(self._teams)))
+        return tuple(map(EntryPlayer, self._players))
+
+    @cached_property
+    def star_player(self: BE) -> Optional[EntryPlayer]:
+        """Optional[`~.EntryPlayer`]: The star player of the battle. `None` if the battle has no star player (i.e. showdown)."""
+        if self._star_player:
+            return EntryPlayer(self._star_player)
+        return None
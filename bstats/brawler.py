@@ -22,10 +22,11 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-from .utils import camel_to_snake
 from typing import (
     Any,
-    List,
+    Iterable,
+    Tuple,
+    Type,
     TypeVar
 )
 
@@ -40,6 +41,8 @@ class Gadget:
     id: `int`
         The gadget's ID.
     """
+    __slots__ = ("_name", "_id")
+
     def __init__(self, gadget: Any) -> None:
         self.push_data(gadget)
 
@@ -47,14 +50,14 @@ class Gadget:
         return f"<{self.__class__.__name__} name={self.name!r} id={self.id}>"
 
     def push_data(self, data: Any) -> None:
-        self._name: str = data["name"]
+        self._name: str = data["name"].title()
         self._id: int = data["id"]
 
 
     @property
     def name(self) -> str:
         """`str`: The gadget's name."""
-        return self._name.title()
+        return self._name
 
     @property
     def id(self) -> int:
@@ -72,6 +75,8 @@ class StarPower:
     id: `int`
         The star power's ID.
     """
+    __slots__ = ("_name", "_id")
+
     def __init__(self, sp: Any) -> None:
         self.push_data(sp)
 
@@ -79,14 +84,14 @@ class StarPower:
         return f"<{self.__class__.__name__} name={self.name!r} id={self.id}>"
 
     def push_data(self, data: Any) -> None:
-        self._name: str = data["name"]
+        self._name: str = data["name"].title()
         self._id: int = data["id"]
 
 
     @property
     def name(self) -> str:
         """`str`: The star power's name."""
-        return self._name.title()
+        return self._name
 
     @property
     def id(self) -> int:
@@ -106,6 +111,8 @@ class Gear:
     level: `int`
         The gear's level.
     """
+    __slots__ = ("_name", "_id", "_level")
+
     def __init__(self, gear: Any) -> None:
         self.push_data(gear)
 
@@ -113,7 +120,7 @@ class Gear:
         return f"<{self.__class__.__name__} name={self.name!r} id={self.id} level={self.level}>"
 
     def push_data(self, data: Any) -> None:
-        self._name: str = data["name"]
+        self._name: str = data["name"].title()
         self._id: int = data["id"]
         self._level: int = data["level"]
 
@@ -121,7 +128,7 @@ class Gear:
     @property
     def name(self) -> str:
         """`str`: The gear's name."""
-        return self._name.title()
+        return self._name
 
     @property
     def id(self) -> int:
@@ -152,15 +159,35 @@ class Brawler:
         The brawler's current trophies.
     highest_trophies: `int`
         The brawler's highest trophies.
-    gadgets: List[`~.Gadget`]
+    gadgets: Tuple[`~.Gadget`, ...]
         A list of gadgets the brawler has unlocked.
-    star_powers: List[`~.StarPower`]
+    star_powers: Tuple[`~.StarPower`, ...]
         A list of star powers the brawler has unlocked.
-    gears: List[`~.Gear`]
+    gears: Tuple[`~.Gear`, ...]
         A list of gears the brawler has crafted.
     """
+    __slots__ = (
+        "_name", "_id", "_power", "_rank", "_trophies", "_highest_trophies",
+        "_gadgets", "_star_powers", "_gears"
+    )
+
     def __init__(self: B, data: Any):
-        self.push_data({camel_to_snake(key): value for key, value in data.items()})
+        self.push_data(data)
+
+    @classmethod
+    def from_payload_list(cls: Type[B], payloads: Iterable[Any], /) -> Tuple[B, ...]:
+        """
+        Build brawlers from a list of brawler payloads (e.g. a profile's or the `/brawlers` endpoint's) in one pass.
+
+        ### Parameters
+        payloads: Iterable[`dict`]
+            The brawler payloads, as returned by the API.
+
+        ### Returns
+        Tuple[`~.Brawler`, ...]
+            The brawlers, in the same order as the payloads.
+        """
+        return tuple(map(cls, payloads))
 
     def __repr__(self: B):
         return f"<{self.__class__.__name__} name={self.name!r} id={self.id} power={self.power} trophies={self.trophies}>"
@@ -169,21 +196,21 @@ class Brawler:
         return f"Rank {self.rank} {self.name!r} (Power {self.power:02d})"
 
     def push_data(self: B, data: Any) -> None:
-        self._name: str = data["name"]
+        self._name: str = data["name"].title()
         self._id: int = data["id"]
         self._power: int = data.get("power")
         self._rank: int = data.get("rank")
         self._trophies: int = data.get("trophies")
-        self._highest_trophies: int = data.get("highest_trophies")
-        self._gadgets: Any = data["gadgets"]
-        self._star_powers: Any = data["star_powers"]
-        self._gears: Any = data["gears"]
+        self._highest_trophies: int = data.get("highestTrophies")
+        self._gadgets: Tuple[Gadget, ...] = tuple(map(Gadget, data.get("gadgets", ())))
+        self._star_powers: Tuple[StarPower, ...] = tuple(map(StarPower, data.get("starPowers", ())))
+        self._gears: Tuple[Gear, ...] = tuple(map(Gear, data.get("gears", ())))
 
 
     @property
     def name(self: B) -> str:
         """`str`: The brawler's name."""
-        return self._name.title()
+        return self._name
 
     @property
     def id(self: B) -> int:
@@ -211,17 +238,17 @@ class Brawler:
         return self._highest_trophies
 
     @property
-    def gadgets(self: B) -> List[Gadget]:
-        """List[`~.Gadget`]: A list of gadgets the brawler has unlocked."""
-        return [Gadget(gadget) for gadget in self._gadgets]
+    def gadgets(self: B) -> Tuple[Gadget, ...]:
+        """Tuple[`~.Gadget`, ...]: A list of gadgets the brawler has unlocked."""
+        return self._gadgets
 
     @property
-    def star_powers(self: B) -> List[StarPower]:
-        """List[`~.StarPower`]: A list of star powers the brawler has unlocked."""
-        return [StarPower(sp) for sp in self._star_powers]
+    def star_powers(self: B) -> Tuple[StarPower, ...]:
+        """Tuple[`~.StarPower`, ...]: A list of star powers the brawler has unlocked."""
+        return self._star_powers
 
     @property
-    def gears(self: B) -> List[Gear]:
-        """List[`~.Gear`]: A list of gears the brawler has crafted."""
-        return [Gear(gear) for gear in self._gears]
+    def gears(self: B) -> Tuple[Gear, ...]:
+        """Tuple[`~.Gear`, ...]: A list of gears the brawler has crafted."""
+        return self._gears
 
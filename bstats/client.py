@@ -22,12 +22,14 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-import asyncio
 import aiohttp
-import re
-import os
+import asyncio
 import sys
+import time
+
+from types import MappingProxyType
 
+from . import __version__ as _VERSION
 from .http import HTTPClient
 from .errors import InappropriateFormat, NoSuppliedToken
 
@@ -40,12 +42,44 @@ from .leaderboard import LeaderboardPlayerEntry, LeaderboardClubEntry
 from .rotation import EventSlot
 
 from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    FrozenSet,
+    Iterable,
     List,
+    Optional,
+    Tuple,
     TypeVar,
     Union,
     overload
 )
 
+# fixed for the lifetime of the process, so it's built once for every client
+_USER_AGENT = f"BStats/{_VERSION} (Python {sys.version_info[0]}.{sys.version_info[1]}, Aiohttp {aiohttp.__version__})"
+
+# turn a response into models; the results (the models themselves included) are shared
+# between calls while the response stays cached, hence tuples (getters hand out list copies)
+def _build_brawlers(data: Any) -> Tuple[Brawler, ...]:
+    return Brawler.from_payload_list(data["items"])
+
+def _build_battlelogs(data: Any) -> Tuple[BattlelogEntry, ...]:
+    return tuple(map(BattlelogEntry, data["items"]))
+
+def _build_rotation(data: Any) -> Tuple[EventSlot, ...]:
+    return tuple(map(EventSlot, data))
+
+# also serves as the set of valid leaderboard modes
+_LEADERBOARD_TYPES = {
+    "players": LeaderboardPlayerEntry,
+    "clubs": LeaderboardClubEntry,
+    "brawlers": LeaderboardPlayerEntry
+}
+
+# how long (in seconds) the brawler list loaded by Client.__ainit__ is reused for
+_BRAWLERS_TTL = 3600
+
+
 C = TypeVar("C", bound="Client")
 class Client:
     """
@@ -58,47 +92,83 @@ class Client:
         If the token is invalid, then you will receive an exception (`errors.Forbidden`).
     timeout (optional, defaults to `45`): `int`
         How long to wait before terminating requests.
+    use_uvloop (optional, defaults to `False`): `bool`
+        Whether to install `uvloop`'s event loop policy, if it is installed.
+        Opt in only if the application doesn't manage its own event loop policy.
+        The policy is process-wide and only affects event loops created afterwards
+        (e.g. by `asyncio.run()`), so it is skipped if a loop is already running.
     """
-    def __init__(self: C, token: str, *, timeout: int = 45) -> None:
-        with open(os.path.join(os.path.dirname(__file__), "__init__.py")) as file:
-            self.VERSION = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", file.read(), re.MULTILINE).group(1)
+    __slots__ = ("VERSION", "token", "timeout", "headers", "http", "BRAWLERS", "_BRAWLERS_CI", "_BRAWLER_IDS")
+
+    # (load time, name -> id, casefolded name -> id, ids); see __ainit__
+    _shared_brawlers: Optional[Tuple[float, Dict[str, int], Dict[str, int], FrozenSet[int]]] = None
+
+    def __init__(self: C, token: str, *, timeout: int = 45, use_uvloop: bool = False) -> None:
+        self.VERSION = _VERSION
 
         if not token:
             raise NoSuppliedToken("You must supply a token to access the API.")
 
         self.token = token
-        try:
-            timeout = int(timeout)
-        except ValueError:
-            raise TypeError(f"timeout type {timeout.__class__.__name__!r} cannot be converted to int.")
-        else:
-            self.timeout = timeout
-
-        self.headers = {
-            "Authorization": "Bearer {}".format(self.token),
-            "User-Agent": "BStats/{v} (Python {pv[0]}.{pv[1]}, Aiohttp {av})"\
-                .format(v=self.VERSION, pv=sys.version_info, av=aiohttp.__version__)
-        }
-
-        self.session = aiohttp.ClientSession(loop=self._make_loop())
-        self.http = HTTPClient(self.session, headers=self.headers, timeout=self.timeout)
+        if type(timeout) is not int:
+            try:
+                timeout = int(timeout)
+            except (TypeError, ValueError):
+                raise TypeError(f"timeout type {timeout.__class__.__name__!r} cannot be converted to int.")
+        self.timeout = timeout
+
+        # read-only; these are handed to the session once as its default headers
+        self.headers = MappingProxyType({
+            "Authorization": f"Bearer {self.token}",
+            "User-Agent": _USER_AGENT
+        })
+
+        self.http = HTTPClient(headers=self.headers, timeout=self.timeout)
+        # loaded by __ainit__, at the latest when a brawler is first passed to get_leaderboards()
+        self.BRAWLERS: Optional[Dict[str, int]] = None
+
+        # the policy is process-wide and can't affect a loop that's already running,
+        # so it's only installed for a valid client created outside of one
+        if use_uvloop:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                try:
+                    import uvloop
+                except ImportError:
+                    pass
+                else:
+                    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     async def __ainit__(self: C) -> None:
-        self.BRAWLERS = {brawler.name: brawler.id for brawler in await self.get_brawlers()}
+        # the brawler list is the same for every token, so it's shared by all clients for an hour
+        shared = Client._shared_brawlers
+        if shared is None or time.monotonic() - shared[0] > _BRAWLERS_TTL:
+            brawlers = {brawler.name: brawler.id for brawler in await self.get_brawlers()}
+            # lookup tables for get_leaderboards(): names are matched case-insensitively
+            brawlers_ci = {name.casefold(): id for name, id in brawlers.items()}
+            shared = Client._shared_brawlers = (time.monotonic(), brawlers, brawlers_ci, frozenset(brawlers.values()))
+
+        _, brawlers, self._BRAWLERS_CI, self._BRAWLER_IDS = shared
+        self.BRAWLERS = dict(brawlers)
 
     def __repr__(self: C) -> str:
         return f"<{self.__class__.__name__} timeout={self.timeout}>"
 
-    def _make_loop(self: C) -> asyncio.AbstractEventLoop:
-        if sys.version_info >= (3, 10):
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        else:
-            loop = asyncio.get_event_loop()
-        return loop
+    async def __aenter__(self: C) -> C:
+        self.http._open_session()
+        return self
+
+    async def __aexit__(self: C, *args: Any) -> None:
+        await self.close()
+
+    async def close(self: C) -> None:
+        """
+        Close the client's session and its connections.
+        - This is done automatically when the client is used as an async context manager:
+        `async with Client("token") as client: ...`
+        """
+        await self.http.close()
 
 
     async def get_player(self: C, tag: str, /) -> Profile:
@@ -119,6 +189,25 @@ class Client:
         return Profile(data)
 
 
+    async def get_players(self: C, tags: Iterable[str], /) -> List[Profile]:
+        """
+        Get multiple players' profiles and their statistics.
+        - The requests are made concurrently, so this is much faster
+        than calling `.get_player()` for each tag one after another.
+
+        ### Parameters
+        tags: Iterable[`str`]
+            The players' tags to use for the requests.
+            If a character other than `0289PYLQGRJCUV` is in a tag,
+            then `errors.InvalidSuppliedTag` is raised.
+
+        ### Returns
+        List[`Profile`]
+            A list of `Profile` objects, in the same order as the supplied tags.
+        """
+        return await asyncio.gather(*map(self.get_player, tags))
+
+
     async def get_club(self: C, tag: str, /) -> Club:
         """
         Get a club and its statistics.
@@ -137,18 +226,39 @@ class Client:
         return Club(data)
 
 
+    async def get_clubs(self: C, tags: Iterable[str], /) -> List[Club]:
+        """
+        Get multiple clubs and their statistics.
+        - The requests are made concurrently, so this is much faster
+        than calling `.get_club()` for each tag one after another.
+
+        ### Parameters
+        tags: Iterable[`str`]
+            The clubs' tags to use for the requests.
+            If a character other than `0289PYLQGRJCUV` is in a tag,
+            then `errors.InvalidSuppliedTag` is raised.
+
+        ### Returns
+        List[`Club`]
+            A list of `Club` objects, in the same order as the supplied tags.
+        """
+        return await asyncio.gather(*map(self.get_club, tags))
+
+
     async def get_brawlers(self: C) -> List[Brawler]:
         """
         Get all the available brawlers and their details.
         - These are not the brawlers a player has!
+        - The returned objects are shared with other calls made while the response is cached,
+        so they should not be modified.
 
         ### Returns
         List[`Brawler`]
             A list of `Brawler` objects representing the available in-game brawlers.
         """
 
-        data = await self.http._get_brawlers()
-        return [Brawler(brawler) for brawler in data["items"]]
+        brawlers = await self.http._get_brawlers(_build_brawlers)
+        return list(brawlers)
 
 
     async def get_members(self: C, tag: str, /) -> List[Member]:
@@ -173,9 +283,27 @@ class Client:
         return [Member(member) for member in data["items"]]
 
 
+    async def iter_members(self: C, tag: str, /) -> AsyncIterator[Member]:
+        """
+        Iterate over a club's members.
+        - Takes the same parameters (and raises the same exceptions) as `.get_members()`,
+        but each member is only built when it is reached, so breaking out early is cheap.
+        `async for member in client.iter_members("#2YR8Q9"): ...`
+
+        ### Yields
+        `Member`
+            The club's members, ordered by trophies.
+        """
+        data = await self.http._get_members(tag)
+        for member in data["items"]:
+            yield Member(member)
+
+
     async def get_battlelogs(self: C, tag: str, /) -> List[BattlelogEntry]:
         """
         Get a player's battlelogs
+        - The returned objects are shared with other calls made while the response is cached,
+        so they should not be modified.
 
         ### Parameters
         tag: `str`
@@ -187,8 +315,8 @@ class Client:
         List[`BattlelogEntry`]
             A list of `BattlelogEntry` objects representing the player's battlelog entries
         """
-        data = await self.http._get_battlelogs(tag)
-        return [BattlelogEntry(entry) for entry in data["items"]]
+        entries = await self.http._get_battlelogs(tag, _build_battlelogs)
+        return list(entries)
 
 
     @overload
@@ -234,16 +362,41 @@ class Client:
         - The given limit is not between 1 and 200.
         """
 
+        return_type, items = await self._fetch_leaderboards(mode, options)
+        return [return_type(entry) for entry in items]
+
+
+    async def iter_leaderboards(self: C, mode: str, **options) -> AsyncIterator[Union[LeaderboardPlayerEntry, LeaderboardClubEntry]]:
+        """
+        Iterate over in-game leaderboard rankings for players, clubs or brawlers.
+        - Takes the same parameters (and raises the same exceptions) as `.get_leaderboards()`,
+        but each entry is only built when it is reached, so breaking out early is cheap.
+        `async for entry in client.iter_leaderboards("players"): ...`
+
+        ### Yields
+        `LeaderboardPlayerEntry` | `LeaderboardClubEntry`
+            The leaderboard entries, in ranking order.
+        """
+        return_type, items = await self._fetch_leaderboards(mode, options)
+        for entry in items:
+            yield return_type(entry)
+
+
+    async def _fetch_leaderboards(self: C, mode: str, options: Dict[str, Any]) -> Tuple[type, List[Any]]:
+        # validates the options shared by get_leaderboards() and iter_leaderboards() and makes the request
         mode = mode.lower()
+        return_type = _LEADERBOARD_TYPES.get(mode)
+        if return_type is None:
+            raise InappropriateFormat(f"'mode' must either be 'players', 'clubs' or 'brawlers', not {mode!r}.")
+
         region = options.pop("region", "global").lower()
         limit = options.pop("limit", 200)
-        try:
-            limit = int(limit)
-        except ValueError:
-            raise InappropriateFormat(f"'limit' must be int or convertible to int,  {limit.__class__.__name__!r}.")
+        if type(limit) is not int:
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                raise InappropriateFormat(f"'limit' must be int or convertible to int,  {limit.__class__.__name__!r}.")
         brawler = options.pop("brawler", None)
-        if brawler:
-            brawler = brawler.title()
 
         # check if every aspect is OK so we can proper request
         if not 0 < limit <= 200:
@@ -251,45 +404,40 @@ class Client:
         if region != "global" and len(region) > 2:
             raise InappropriateFormat(f"{region!r} is not a valid region. Regions must be passed in as their two-letter representative.")
         if brawler:
-            if isinstance(brawler, (str, int)):
+            if not isinstance(brawler, (str, int)):
+                raise InappropriateFormat(f"'brawler' must be int or str, not {brawler.__class__.__name__!r}")
+            if self.BRAWLERS is None:
+                await self.__ainit__()
+
+            if isinstance(brawler, str):
+                # int() decides what counts as an ID (e.g. " 16000000" or "+16000000"),
+                # anything it rejects is looked up as a name
                 try:
                     brawler = int(brawler)
                 except ValueError:
-                    try:
-                        brawler = self.BRAWLERS[brawler]
-                    except KeyError:
+                    brawler_id = self._BRAWLERS_CI.get(brawler.casefold())
+                    if brawler_id is None:
                         raise InappropriateFormat(f"{brawler!r} is not a valid brawler.")
-                else:
-                    if brawler not in self.BRAWLERS.values():
-                        raise InappropriateFormat(f"Brawler with ID {brawler!r} is not a valid brawler.")
-            else:
-                raise InappropriateFormat(f"'brawler' must be int or str, not {brawler.__class__.__name__!r}")
+                    brawler = brawler_id
+            if brawler not in self._BRAWLER_IDS:
+                raise InappropriateFormat(f"Brawler with ID {brawler!r} is not a valid brawler.")
         else:
             if mode == "brawlers":
                 raise InappropriateFormat("You must supply a brawler name or ID if you want to get the 'brawlers' leaderboard rankings.")
 
-        m = {
-            "players": LeaderboardPlayerEntry,
-            "clubs": LeaderboardClubEntry,
-            "brawlers": LeaderboardPlayerEntry
-        }
-
-        try:
-            return_type = m[mode]
-        except KeyError:
-            raise InappropriateFormat(f"'mode' must either be 'players', 'clubs' or 'brawlers', not {mode!r}.")
-        else:
-            data = await self.http._get_leaderboards(mode, region, limit, brawler)
-            return [return_type(entry) for entry in data["items"]]
+        data = await self.http._get_leaderboards(mode, region, limit, brawler)
+        return return_type, data["items"]
 
 
     async def get_event_rotation(self) -> List[EventSlot]:
         """
         Get the current in-game event rotation.
+        - The returned objects are shared with other calls made while the response is cached,
+        so they should not be modified.
 
         ### Returns
         List[`Rotation`]
             A list of `Rotation` objects representing the current event rotation.
         """
-        data = await self.http._get_event_rotation()
-        return [EventSlot(event) for event in data]
+        slots = await self.http._get_event_rotation(_build_rotation)
+        return list(slots)
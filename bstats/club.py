@@ -23,11 +23,11 @@ DEALINGS IN THE SOFTWARE.
 """
 
 from .member import Member
-from .utils import camel_to_snake
 
 from typing import (
-    List,
     Any,
+    Optional,
+    Tuple,
     TypeVar
 )
 
@@ -47,17 +47,20 @@ class Club:
         The club's current total trophies.
     required_trophies: `int`
         The trophies that are required for a new member to join.
-    members: List[`~.Member`]
-        A list consisting of `Member` objects, representing the club's members.
+    members: Tuple[`~.Member`, ...]
+        A tuple consisting of `Member` objects, representing the club's members.
     type: `str`
         The club's type (i.e. "Open"/"Invite Only"/"Closed").
     badge_id: `int`
         The club's badge ID.
-    president: `~.Member`
+    president: Optional[`~.Member`]
         A `Member` object representing the club's president.
+        `None` if the club's president is not in the members list.
     """
+    __slots__ = ("_name", "_tag", "_description", "_trophies", "_required_trophies", "_type", "_badge_id", "_members", "_president")
+
     def __init__(self: C, club: Any) -> None:
-        self.push_data({camel_to_snake(key): value for key, value in club.items()})
+        self.push_data(club)
 
     def __repr__(self: C) -> str:
         return f"<{self.__class__.__name__} name={self.name!r} tag={self.tag!r} members={len(self.members)}>"
@@ -70,10 +73,12 @@ class Club:
         self._tag: str = data["tag"]
         self._description: str = data["description"]
         self._trophies: int = data["trophies"]
-        self._required_trophies: str = data["required_trophies"]
+        self._required_trophies: str = data["requiredTrophies"]
         self._type: str = data["type"]
-        self._badge_id: int = data["badge_id"]
-        self._members: Any = data["members"]
+        self._badge_id: int = data["badgeId"]
+        self._members: Tuple[Member, ...] = tuple(map(Member, data["members"]))
+        # members are ordered by trophies, so the president has to be searched for (once)
+        self._president: Optional[Member] = next((m for m in self._members if m.role == "President"), None)
 
 
     @property
@@ -102,9 +107,9 @@ class Club:
         return self._required_trophies
 
     @property
-    def members(self: C) -> List[Member]:
-        """List[`~.Member`]: A list consisting of `Member` objects, representing the club's members."""
-        return [Member(member) for member in self._members]
+    def members(self: C) -> Tuple[Member, ...]:
+        """Tuple[`~.Member`, ...]: A tuple consisting of `Member` objects, representing the club's members."""
+        return self._members
 
     @property
     def type(self: C) -> str:
@@ -119,8 +124,6 @@ class Club:
         return self._badge_id
 
     @property
-    def president(self: C) -> Member:
-        """`~.Member`: A `Member` object representing the club's president."""
-        for m in self.members:
-            if m.role == "President":
-                return m
+    def president(self: C) -> Optional[Member]:
+        """Optional[`~.Member`]: A `Member` object representing the club's president, or `None` if they are not in the members list."""
+        return self._president
@@ -22,6 +22,8 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
+from http import HTTPStatus as _HTTPStatus
+
 class APIException(Exception):
     """
     Base class for all library exceptions, includes all the errors thrown by this library.
@@ -40,7 +42,9 @@ class HTTPError(APIException):
     - `503`: API is down (most likely due to maintenance)
     """
     def __init__(self, response, code, message):
-        super().__init__(f"{response.reason} (Status Code {code}): {message}")
+        # there is no response to take the reason from when the request timed out
+        reason = response.reason if response is not None else _HTTPStatus(code).phrase
+        super().__init__(f"{reason} (Status Code {code}): {message}")
 
 class ProcessingError(APIException):
     """
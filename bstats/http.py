@@ -24,13 +24,22 @@ DEALINGS IN THE SOFTWARE.
 
 import aiohttp
 import asyncio
-import json
+import ssl
 
-from cachetools import TTLCache
-from typing import Any, Callable, Mapping, Optional, Union
+# all of these parse straight from bytes; prefer the fastest one that's installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        from json import loads as _json_loads
+
+from cachetools import LRUCache, TTLCache
+from typing import Any, Callable, Mapping, Optional, Tuple, TypeVar, Union
 
 from .utils import format_tag
-from .errors import Forbidden, NotFound, RateLimited, UnknownServerError, MaintenanceError
+from .errors import HTTPError, Forbidden, NotFound, RateLimited, UnknownServerError, MaintenanceError
 
 class APIRoute:
     """
@@ -42,13 +51,16 @@ class APIRoute:
         The full request URL.
     """
     BASE: str = "https://api.brawlstars.com/v1"
+    __slots__ = ("path", "_base")
+
     def __init__(self, path: str) -> None:
+        self._base: Optional[str] = None
         self.path = path
 
     @property
     def base_url(self):
         """`str`: The raw Base URL (without endpoints) for all API requests."""
-        return self.BASE
+        return self.BASE if self._base is None else self._base
 
     @base_url.setter
     def base_url(self, new_base: str):
@@ -59,90 +71,178 @@ class APIRoute:
         new_base: `str`
             The new Base URL.
         """
-        self.BASE = new_base
+        self._base = new_base
 
     @property
     def url(self) -> str:
         """`str`: The full request URL."""
-        return self.BASE + self.path
+        return self.base_url + self.path
 
 
-# 300K items for 5 minutes
-# this should be enough... right?
+_EXC_MAPPING = {
+    403: (Forbidden, "The API token you supplied is invalid. Authorization failed."),
+    404: (NotFound, "The item requested has not been found."),
+    429: (RateLimited, "You are being rate-limited. Please retry in a few moments."),
+    500: (UnknownServerError, "An unexpected error has occurred.\n{data}"),
+    503: (MaintenanceError, "The API is down due to in-game maintenance. Please be patient and try again later.")
+}
+_UNMAPPED_EXC = (HTTPError, "The request was unsuccessful.\n{data}")
 
+
+T = TypeVar("T")
 class HTTPClient:
-    def __init__(self, session: aiohttp.ClientSession, *, headers: Mapping[str, str], timeout: int) -> None:
-        self.__cache = TTLCache(maxsize=3000*1024, ttl=300)
-        self.session: aiohttp.ClientSession = session
+    __slots__ = ("__caches", "__validators", "__built", "__ssl", "session", "headers", "timeout")
+
+    def __init__(self, *, headers: Mapping[str, str], timeout: int) -> None:
+        # one cache per kind of endpoint, each sized and timed for how often its data changes,
+        # so that e.g. a burst of one-off player lookups cannot evict the brawler list
+        self.__caches = {
+            "players": TTLCache(maxsize=2048, ttl=300),
+            "battlelogs": TTLCache(maxsize=1024, ttl=30),
+            "clubs": TTLCache(maxsize=2048, ttl=300),
+            "brawlers": TTLCache(maxsize=16, ttl=3600),
+            "rankings": TTLCache(maxsize=256, ttl=300),
+            "rotation": TTLCache(maxsize=1, ttl=300),
+            "other": TTLCache(maxsize=1024, ttl=300)
+        }
+        # url -> (ETag, Last-Modified, body); outlives the TTL caches so that expired
+        # entries can be revalidated with a conditional request instead of refetched
+        self.__validators = LRUCache(maxsize=4096)
+        # url -> (body, models built from it); see _request_built()
+        self.__built = LRUCache(maxsize=1024)
+        self.__ssl: Optional[ssl.SSLContext] = None
+        self.session: Optional[aiohttp.ClientSession] = None
         self.headers: Mapping[str, str] = headers
         self.timeout: int = timeout
 
-
-    async def _read_resp(self, response: aiohttp.ClientResponse) -> Union[Any, str]:
-        if response.headers["Content-Type"][:16] == "application/json":
-            return json.loads(await response.text())
-        return await response.text()
-
-    async def request(self, url: str, /) -> Callable[[aiohttp.ClientResponse], Optional[Union[Any, str]]]:
+    def _open_session(self) -> aiohttp.ClientSession:
+        # opened from within a coroutine (on entering the client or on the first request),
+        # so that the session and its connection pool belong to the running event loop
+        if self.session is None or self.session.closed:
+            # verified TLS; the context (and the CA certificates it loads) is built once and reused
+            if self.__ssl is None:
+                self.__ssl = ssl.create_default_context()
+            connector = aiohttp.TCPConnector(ssl=self.__ssl, limit=32, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=75)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self.session
+
+    async def close(self) -> None:
+        """Close the underlying session, if one has been opened."""
+        session, self.session = self.session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+
+    async def _read_resp(self, response: aiohttp.ClientResponse) -> Tuple[Optional[bytes], Union[Any, str]]:
+        # JSON bodies are also returned raw, as that's what gets cached
+        body = await response.read()
+        if response.content_type == "application/json":
+            return body, _json_loads(body)
+        return None, body.decode(response.get_encoding())
+
+    async def request(self, url: str, /, *, cache: str = "other") -> Callable[[aiohttp.ClientResponse], Optional[Union[Any, str]]]:
         """
         Perform a GET API request.
 
         ### Parameters
         url: `str`
             The URL to use for the request.
+        cache (optional, defaults to `other`): `str`
+            The name of the cache to look up and store the response in.
         """
-        cache_res = self.__cache.get(url)
-        if cache_res:
-            return cache_res
+        # raw bodies are cached rather than the parsed data, so every caller gets
+        # objects of its own (re-parsing is cheap) and cached entries stay compact
+        cache = self.__caches[cache]
+        cache_res = cache.get(url)
+        if cache_res is not None:
+            return _json_loads(cache_res)
+
+        headers = None
+        validators = self.__validators.get(url)
+        if validators is not None:
+            etag, last_modified, stale = validators
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
 
         try:
-            async with self.session.get(url, headers=self.headers, timeout=self.timeout) as response:
-                data = await self._read_resp(response)
+            async with self._open_session().get(url, headers=headers) as response:
+                if response.status == 304 and validators is not None:
+                    # not modified since we last fetched it, so the stored data is still current
+                    cache[url] = stale
+                    return _json_loads(stale)
+                body, data = await self._read_resp(response)
         except asyncio.TimeoutError:
-            raise MaintenanceError(response, 503, "The API is down due to in-game maintenance. Please be patient and try again later.")
+            raise MaintenanceError(None, 503, "The API is down due to in-game maintenance. Please be patient and try again later.")
 
         # all good. data has been retrieved and API is functional
         code = response.status
-        exc_mapping = {
-            403: {"exc": Forbidden, "message": "The API token you supplied is invalid. Authorization failed."},
-            404: {"exc": NotFound, "message": "The item requested has not been found."},
-            429: {"exc": RateLimited, "message": "You are being rate-limited. Please retry in a few moments."},
-            500: {"exc": UnknownServerError, "message": "An unexpected error has occurred.\n{}".format(data)},
-            503: {"exc": MaintenanceError, "message": "The API is down due to in-game maintenance. Please be patient and try again later."}
-        }
 
         if 200 <= code < 300:
-            self.__cache[url] = data
+            if body is not None:
+                cache[url] = body
+                etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self.__validators[url] = (etag, last_modified, body)
             return data
         else:
-            args = exc_mapping.get(code)
-            if args:
-                raise args["exc"](response, code, args["message"])
+            # codes without a dedicated exception (e.g. 400) still shouldn't pass silently
+            exc, message = _EXC_MAPPING.get(code, _UNMAPPED_EXC)
+            raise exc(response, code, message.format(data=data))
+
+
+    async def _request_built(self, url: str, /, *, cache: str, build: Callable[[Any], T]) -> T:
+        # for endpoints whose data is only ever turned into models: the models are kept for
+        # as long as the body they were built from stays cached, and the very same objects
+        # are handed to every caller in the meantime
+        cached = self.__caches[cache]
+        body = cached.get(url)
+        if body is not None:
+            built = self.__built.get(url)
+            if built is not None and built[0] is body:
+                return built[1]
+
+        data = await self.request(url, cache=cache)
+        body = cached.get(url)
+        if body is None:
+            return build(data)
+
+        built = self.__built.get(url)
+        if built is not None and built[0] is body:
+            # revalidated (304) with the body unchanged, so the stored models still hold
+            return built[1]
+        result = build(data)
+        self.__built[url] = (body, result)
+        return result
 
 
     async def _get_player(self, tag: str, /) -> Callable[[str], Optional[Union[Any, str]]]:
-        return await self.request(APIRoute(f"/players/{format_tag(tag)}").url)
+        return await self.request(f"{APIRoute.BASE}/players/{format_tag(tag)}", cache="players")
 
     async def _get_club(self, tag: str, /) -> Callable[[str], Optional[Union[Any, str]]]:
-        return await self.request(APIRoute(f"/clubs/{format_tag(tag)}").url)
+        return await self.request(f"{APIRoute.BASE}/clubs/{format_tag(tag)}", cache="clubs")
 
-    async def _get_brawlers(self) -> Callable[[str], Optional[Union[Any, str]]]:
-        return await self.request(APIRoute("/brawlers").url)
+    async def _get_brawlers(self, build: Callable[[Any], T]) -> T:
+        return await self._request_built(f"{APIRoute.BASE}/brawlers", cache="brawlers", build=build)
 
     async def _get_members(self, tag: str, /) -> Callable[[str], Optional[Union[Any, str]]]:
-        return await self.request(APIRoute(f"/clubs/{format_tag(tag)}/members"))
+        return await self.request(f"{APIRoute.BASE}/clubs/{format_tag(tag)}/members", cache="clubs")
 
-    async def _get_battlelogs(self, tag: str, /) -> Callable[[str], Optional[Union[Any, str]]]:
-        return await self.request(APIRoute(f"/players/{format_tag(tag)}/battlelog").url)
+    async def _get_battlelogs(self, tag: str, /, build: Callable[[Any], T]) -> T:
+        return await self._request_built(f"{APIRoute.BASE}/players/{format_tag(tag)}/battlelog", cache="battlelogs", build=build)
 
     async def _get_leaderboards(self, mode, region, limit, brawler) -> Callable[[str], Optional[Union[Any, str]]]:
-        url = "/rankings/{region}/{mode}"
-        if mode == "brawlers":
-            url += "/{brawler}"
+        path = f"/rankings/{region}/{mode}/{brawler}" if mode == "brawlers" else f"/rankings/{region}/{mode}"
         if limit < 200:
-            url += "?limit={limit}"
+            path = f"{path}?limit={limit}"
 
-        return await self.request(APIRoute(url.format(region=region, mode=mode, brawler=brawler, limit=limit)).url)
+        return await self.request(APIRoute.BASE + path, cache="rankings")
 
-    async def _get_event_rotation(self) -> Callable[[str], Optional[Union[Any, str]]]:
-        return await self.request(APIRoute("/events/rotation").url)
+    async def _get_event_rotation(self, build: Callable[[Any], T]) -> T:
+        return await self._request_built(f"{APIRoute.BASE}/events/rotation", cache="rotation", build=build)
@@ -22,7 +22,6 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-from .utils import camel_to_snake
 from typing import (
     Optional,
     Any,
@@ -47,14 +46,16 @@ class LeaderboardPlayerEntry:
         The hex code representing the player's name colour (#XXXXXX).
     color: `str`
         An alias of `.colour`.
-    icon_id: `int`
+    icon_id: Optional[`int`]
         The ID of the player's icon.
     club_name: Optional[`str`]
         The player's club's name.
         `None` if the member is not in any club.
     """
+    __slots__ = ("_name", "_tag", "_trophies", "_rank", "_colour", "_icon_id", "_club_name")
+
     def __init__(self: LPE, ranking: Any) -> None:
-        self.push_data({camel_to_snake(key): value for key, value in ranking.items()})
+        self.push_data(ranking)
 
     def __repr__(self: LPE) -> str:
         return f"<{self.__class__.__name__} rank={self.rank} name={self.name!r} tag={self.tag!r}>"
@@ -67,9 +68,11 @@ class LeaderboardPlayerEntry:
         self._tag = data["tag"]
         self._trophies = data["trophies"]
         self._rank = data["rank"]
-        self._colour = data["name_color"]
-        self._icon_id = data["icon"]["id"]
-        self._club = data.get("club")
+        self._colour = data["nameColor"]
+        # optional parts of the payload are resolved here, once, rather than on every access
+        icon, club = data.get("icon"), data.get("club")
+        self._icon_id = icon["id"] if icon else None
+        self._club_name = club["name"] if club else None
 
 
     @property
@@ -103,16 +106,14 @@ class LeaderboardPlayerEntry:
         return self.colour
 
     @property
-    def icon_id(self: LPE) -> int:
-        """`int`: The ID of the player's icon."""
+    def icon_id(self: LPE) -> Optional[int]:
+        """Optional[`int`]: The ID of the player's icon."""
         return self._icon_id
 
     @property
     def club_name(self: LPE) -> Optional[str]:
         """Optional[`str`]: The player's club's name. `None` if the member is not in any club."""
-        if self._club:
-            return self._club["name"]
-        return None
+        return self._club_name
 
 LCE = TypeVar("LCE", bound="LeaderboardClubEntry")
 class LeaderboardClubEntry:
@@ -133,22 +134,24 @@ class LeaderboardClubEntry:
     badge_id: `int`
         The club's badge ID.
     """
+    __slots__ = ("_name", "_tag", "_trophies", "_rank", "_member_count", "_badge_id")
+
     def __init__(self: LCE, ranking: Any) -> None:
-        self.push_data({camel_to_snake(key): value for key, value in ranking.items()})
+        self.push_data(ranking)
 
     def __repr__(self: LCE) -> str:
-        return f"<{self.__class__.__name__} rank={self.ranking['rank']} name={self.ranking['name']!r} tag={self.ranking['tag']!r}>"
+        return f"<{self.__class__.__name__} rank={self.rank} name={self.name!r} tag={self.tag!r}>"
 
     def __str__(self: LCE) -> str:
-        return f"Rank {self.ranking['rank']}: {self.ranking['name']} ({self.ranking['tag']})"
+        return f"Rank {self.rank}: {self.name} ({self.tag})"
 
     def push_data(self: LCE, data: Any) -> None:
         self._name = data["name"]
         self._tag = data["tag"]
         self._trophies = data["trophies"]
         self._rank = data["rank"]
-        self._member_count = data["member_count"]
-        self._badge_id = data["badge_id"]
+        self._member_count = data["memberCount"]
+        self._badge_id = data["badgeId"]
 
 
     @property
@@ -22,8 +22,6 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-from .utils import camel_to_snake
-
 from typing import (
     Any,
     TypeVar
@@ -50,8 +48,10 @@ class Member:
     icon_id: `int`
         The member's icon ID.
     """
+    __slots__ = ("_name", "_tag", "_colour", "_role", "_trophies", "_icon_id")
+
     def __init__(self: M, member: Any) -> None:
-        self.push_data({camel_to_snake(key): value for key, value in member.items()})
+        self.push_data(member)
 
     def __repr__(self: M) -> str:
         return f"<Member name={self.name!r} tag={self.tag!r} trophies={self.trophies} role={self.role}>"
@@ -62,7 +62,7 @@ class Member:
     def push_data(self: M, data: Any) -> None:
         self._name: str = data["name"]
         self._tag: str = data["tag"]
-        self._colour: str = data["name_color"]
+        self._colour: str = data["nameColor"]
         self._role: str = data["role"]
         self._trophies: int = data["trophies"]
         self._icon_id: int = data["icon"]["id"]
@@ -86,7 +86,7 @@ class Member:
     @property
     def colour(self: M) -> str:
         """`str`: An alias of `.color`."""
-        return self._color
+        return self.color
 
     @property
     def role(self: M) -> str:
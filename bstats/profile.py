@@ -22,16 +22,13 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-import asyncio
-
-from .club import Club
 from .brawler import Brawler
 
-from .utils import camel_to_snake
-
+from functools import cached_property
 from typing import (
-    List,
     Any,
+    Optional,
+    Tuple,
     TypeVar
 )
 
@@ -76,16 +73,23 @@ class Profile:
         The player's amount of solo showdown victories.
     duo_victories: `int`
         The player's amount of duo showdown victories.
-    club: `Club`
-        A `Club` object representing the player's club.
-    brawlers: List[`Brawler`]
-        A list consisting of `Brawler` objects, representing the player's brawlers.
+    club: Optional[`str`]
+        The player's club's tag, to use with `Client.get_club()`.
+        `None` if the player is in no club.
+    brawlers: Tuple[`Brawler`, ...]
+        A tuple consisting of `Brawler` objects, representing the player's brawlers.
     """
+    __slots__ = (
+        "_name", "_tag", "_trophies", "_highest_trophies", "_colour", "_icon_id", "_is_cc_qualified",
+        "_level", "_exp", "_x3vs3_victories", "_solo_victories", "_duo_victories", "_club", "_brawlers",
+        "__dict__" # storage for the cached properties
+    )
+
     def __init__(self: P, data: Any) -> None:
-        self.push_data({camel_to_snake(key): value for key, value in data.items()})
+        self.push_data(data)
 
     def __repr__(self: P) -> str:
-        return f"<{self.__class__.__name__} name={self.name!r} tag={self.tag!r} brawlers={len(self.brawlers)}>"
+        return f"<{self.__class__.__name__} name={self.name!r} tag={self.tag!r} brawlers={len(self._brawlers)}>"
 
     def __str__(self: P) -> str:
         return f"{self.name} ({self.tag})"
@@ -94,15 +98,15 @@ class Profile:
         self._name: str = data["name"]
         self._tag: str = data["tag"]
         self._trophies: int = data["trophies"]
-        self._highest_trophies: int = data["highest_trophies"]
-        self._colour: str = data["name_color"]
+        self._highest_trophies: int = data["highestTrophies"]
+        self._colour: str = data["nameColor"]
         self._icon_id: int = data["icon"]["id"]
-        self._is_cc_qualified: bool = data["is_qualified_from_championship_challenge"]
-        self._level: int = data["exp_level"]
-        self._exp: int = data["exp_points"]
-        self._x3vs3_victories: int = data["3vs3_victories"]
-        self._solo_victories: int = data["solo_victories"]
-        self._duo_victories: int = data["duo_victories"]
+        self._is_cc_qualified: bool = data["isQualifiedFromChampionshipChallenge"]
+        self._level: int = data["expLevel"]
+        self._exp: int = data["expPoints"]
+        self._x3vs3_victories: int = data["3vs3Victories"]
+        self._solo_victories: int = data["soloVictories"]
+        self._duo_victories: int = data["duoVictories"]
         self._club: Any = data["club"]
         self._brawlers: Any = data["brawlers"]
 
@@ -183,12 +187,12 @@ class Profile:
         return self._duo_victories
 
     @property
-    def club(self: P) -> str:
-        """`str`: The club's tag. Useful to easily access the club's info via `.get_club()`."""
-        return self._club.pop("tag", None)
+    def club(self: P) -> Optional[str]:
+        """Optional[`str`]: The club's tag. Useful to easily access the club's info via `.get_club()`. `None` if the player is in no club."""
+        return self._club.get("tag")
 
-    @property
-    def brawlers(self: P) -> List[Brawler]:
-        """List[`Brawler`]: A list consisting of `Brawler` objects, representing the player's brawlers."""
-        return [Brawler(brawler) for brawler in self._brawlers]
+    @cached_property
+    def brawlers(self: P) -> Tuple[Brawler, ...]:
+        """Tuple[`Brawler`, ...]: A tuple consisting of `Brawler` objects, representing the player's brawlers."""
+        return Brawler.from_payload_list(self._brawlers)
 
@@ -23,7 +23,7 @@ DEALINGS IN THE SOFTWARE.
 """
 
 import datetime
-from .utils import camel_to_snake
+from .utils import format_mode, parse_time
 
 from typing import (
     TypeVar,
@@ -42,6 +42,8 @@ class EventDetails:
     id: `int`
         The event slot's map ID.
     """
+    __slots__ = ("_mode", "_map", "_id")
+
     def __init__(self, event: Any) -> None:
         self.push_data(event)
 
@@ -57,8 +59,7 @@ class EventDetails:
     @property
     def mode(self) -> str:
         """`str`: The event's mode name."""
-        f = " ".join(camel_to_snake(self._mode).split("_"))
-        return f.title()
+        return format_mode(self._mode)
 
     @property
     def map(self) -> str:
@@ -86,27 +87,29 @@ class EventSlot:
     event: `EventDetails`
         An `EventDetails` object representing the event's details.
     """
+    __slots__ = ("_start", "_end", "_event")
+
     def __init__(self: ES, rotation: Any) -> None:
-        self.push_data({camel_to_snake(key): value for key, value in rotation.items()})
+        self.push_data(rotation)
 
     def __repr__(self: ES) -> str:
         return f"<{self.__class__.__name__} mode={self.event.mode!r} map={self.event.map!r}>"
 
     def push_data(self: ES, data: Any) -> None:
-        self._start = data["start_time"]
-        self._end = data["end_time"]
+        self._start = data["startTime"]
+        self._end = data["endTime"]
         self._event = data["event"]
 
 
     @property
     def start(self: ES) -> datetime.datetime:
         """`datetime.datetime`: The time that the event came into rotation."""
-        return datetime.datetime.strptime(self._start, "%Y%m%dT%H%M%S.%fZ")
+        return parse_time(self._start)
 
     @property
     def end(self: ES) -> datetime.datetime:
         """`datetime.datetime`: The time that the event will come out of rotation."""
-        return datetime.datetime.strptime(self._end, "%Y%m%dT%H%M%S.%fZ")
+        return parse_time(self._end)
 
     @property
     def ends_in(self: ES) -> int:
@@ -24,14 +24,21 @@ DEALINGS IN THE SOFTWARE.
 
 import re
 
-from urllib.parse import quote
+from datetime import datetime
+from functools import lru_cache
 from .errors import InvalidSuppliedTag
 
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+_TAG_CHARS = frozenset("0289PYLQGRJCUV")
+_TAG_RE = re.compile(r"[0289PYLQGRJCUV]+")
 
+
+@lru_cache(maxsize=512)
 def camel_to_snake(text: str) -> str:
     """
     A helper function to convert `camelCase` to `snake_case`.
     - e.g. `bestBigBrawlerTime` -> `best_big_brawler_time`
+    - Results are cached, as the same keys get converted over and over.
 
     ### Parameters
     text: `str`
@@ -41,9 +48,53 @@ def camel_to_snake(text: str) -> str:
     `str`
         The restructured `snake_case` text.
     """
-    return re.compile(r"(?<!^)(?=[A-Z])").sub("_", text).lower()
+    return _CAMEL_RE.sub("_", text).lower()
+
+
+@lru_cache(maxsize=128)
+def format_mode(mode: str) -> str:
+    """
+    A helper function to convert an API mode name to its display name.
+    - e.g. `gemGrab` -> `Gem Grab`
+
+    Mode names come from a small, fixed set, so results are cached.
+
+    ### Parameters
+    mode: `str`
+        The mode name, as returned by the API.
+
+    ### Returns
+    `str`
+        The formatted mode name.
+    """
+    capitalize = str.capitalize
+    return " ".join([capitalize(word) for word in camel_to_snake(mode).split("_")])
+
+
+def parse_time(timestamp: str, /) -> datetime:
+    """
+    A helper function to convert an API timestamp to a `datetime.datetime` object.
+    - e.g. `20220723T120501.000Z` -> `datetime.datetime(2022, 7, 23, 12, 5, 1)`
+
+    The timestamps are fixed-width, so they are sliced directly
+    instead of going through `datetime.datetime.strptime()`.
+
+    ### Parameters
+    timestamp: `str`
+        The timestamp to convert, following the `YYYYMMDDTHHMMSS.sssZ` format.
+
+    ### Returns
+    `datetime.datetime`
+        The converted timestamp.
+    """
+    return datetime(
+        int(timestamp[0:4]), int(timestamp[4:6]), int(timestamp[6:8]),
+        int(timestamp[9:11]), int(timestamp[11:13]), int(timestamp[13:15]),
+        int(timestamp[16:-1].ljust(6, "0"))
+    )
 
 
+@lru_cache(maxsize=4096)
 def format_tag(tag: str) -> str:
     """
     A helper function to format the tag in the correct format for API calls.
@@ -66,10 +117,11 @@ def format_tag(tag: str) -> str:
     if len(tag) < 3:
         raise InvalidSuppliedTag("Could not format tag, tag less than 3 characters.")
 
-    invalid = tuple(dict.fromkeys([c for c in tag if c not in set("0289PYLQGRJCUV")]))
-    if invalid:
+    if _TAG_RE.fullmatch(tag) is None:
+        invalid = tuple(dict.fromkeys([c for c in tag if c not in _TAG_CHARS]))
         raise InvalidSuppliedTag("A tag with invalid characters has been supplied.\nInvalid character(s): {}".format(", ".join(invalid)))
-    return quote(f"#{tag}")
+    # valid tags are alphanumeric, so "#" is the only character that needs quoting
+    return "%23" + tag
 
 
 def calculate_exp(exp_points: int, /) -> str:
@@ -2,8 +2,10 @@ import re
 
 from setuptools import setup
 
+_VERSION_RE = re.compile(r"^__version__\s*=\s*['\"]([^'\"]*)['\"]", re.MULTILINE)
+
 with open("bstats/__init__.py") as file:
-    version = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", file.read(), re.MULTILINE).group(1)
+    version = _VERSION_RE.search(file.read()).group(1)
 
 with open("README.md") as file:
     readme = file.read()
@@ -13,10 +15,10 @@ if version.endswith(("a", "b", "rc")):
     try:
         import subprocess
 
-        process = subprocess.Popen(["git", "rev-parse", "--short", "HEAD"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        _out, _err = process.communicate()
-        if _out:
-            version += "+" + _out.decode("UTF-8").strip()
+        # bounded, so that a hanging git (e.g. waiting on a prompt) can't stall the build
+        process = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, timeout=2, check=False)
+        if process.returncode == 0 and process.stdout:
+            version += "+" + process.stdout.decode("UTF-8").strip()
     except Exception:
         pass
 
@@ -35,7 +37,10 @@ setup(
     long_description=readme,
     long_description_content_type="text/markdown",
     python_requires=">=3.8",
-    install_requires=["aiohttp>=3.7.0,<3.9", "cachetools>=4.1.0", "requests"],
+    install_requires=["aiohttp>=3.7.0,<3.9", "cachetools>=4.1.0"],
+    extras_require={
+        "speed": ["orjson", "uvloop; platform_system != 'Windows'"]
+    },
     include_package_data=True,
     classifiers=[
         "Development Status :: 3 - Alpha",